@@ -20,6 +20,10 @@ from app.shared.contracts.registry import all_contracts
 
 from .bus import Envelope, Handler, QueryResult
 
+# Command retry backoff: base * 2**attempts seconds, capped at max
+_BACKOFF_BASE = 0.25
+_BACKOFF_MAX = 10.0
+
 
 class LocalBus:
     """In-process asyncio-based message bus for thread mode.
@@ -242,7 +246,7 @@ class LocalBus:
                     if env.attempts < env.max_attempts:
                         self._stats["retries"] += 1
                         # Calculate backoff delay
-                        delay = min(0.25 * (2**env.attempts), 10.0)
+                        delay = min(_BACKOFF_BASE * (2**env.attempts), _BACKOFF_MAX)
                         await asyncio.sleep(delay)
                         # Re-queue with same priority and new counter
                         queue.task_done()  # Mark current task done before re-queueing
@@ -3,12 +3,13 @@ import json
 import os
 import tempfile
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from copy import deepcopy
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from threading import RLock
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, ValidationError
@@ -27,6 +28,7 @@ class ConfigManager:
     _instance = None
     _lock = RLock()
     _schema = None
+    _field_metadata = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -51,6 +53,7 @@ class ConfigManager:
         """Load configuration from JSON file, create default if not exists"""
         try:
             self._schema = self._get_config_schema()  # Ensure schema is loaded
+            self._field_metadata = None  # Schema may have changed; rebuild metadata lazily
             # Bind mounts sometimes expose `config.json` as a directory (wrong compose context);
             # fall back to image-baked path used by Dockerfiles.
             if os.path.isdir(self.config_file):
@@ -657,7 +660,18 @@ class ConfigManager:
             log_error(f"Failed to load config schema from {schema_path}: {e}")
             return {}
 
-    def get_field_metadata(self) -> dict[str, dict[str, Any]]:
+    def get_field_metadata(self) -> Mapping[str, dict[str, Any]]:
+        """Return field metadata for UI generation, extracting it from the schema on first use.
+
+        The result is cached on the instance behind a read-only mapping view; the
+        per-field dicts inside it are shared, so callers must copy before modifying
+        them. load_config() invalidates the cache.
+        """
+        if self._field_metadata is None:
+            self._field_metadata = MappingProxyType(self._build_field_metadata())
+        return self._field_metadata
+
+    def _build_field_metadata(self) -> dict[str, dict[str, Any]]:
         """Extract field metadata from the configuration schema for UI generation"""
         metadata = {}
         self._schema = self._get_config_schema()  # Ensure schema is loaded
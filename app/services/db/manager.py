@@ -52,33 +52,50 @@ class DatabaseManager:
 
         log_info("Database initialization completed")
 
+    _INSERT_MESSAGE_SQL = """
+        INSERT INTO messages (
+            id, content, message_type, timestamp,
+            session_id, metadata, source_type
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _message_params(message: Message) -> tuple:
+        """Build the INSERT parameters for a message row"""
+        return (
+            message.id,
+            message.content,
+            message.message_type.value,
+            message.timestamp.isoformat(),
+            message.session_id,
+            json.dumps(message.metadata) if message.metadata else None,
+            message.source_type,
+        )
+
     async def store_message(self, message: Message) -> bool:
         """Store a message in the database"""
         try:
             async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """
-                    INSERT INTO messages (
-                        id, content, message_type, timestamp,
-                        session_id, metadata, source_type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        message.id,
-                        message.content,
-                        message.message_type.value,
-                        message.timestamp.isoformat(),
-                        message.session_id,
-                        json.dumps(message.metadata) if message.metadata else None,
-                        message.source_type,
-                    ),
-                )
+                await db.execute(self._INSERT_MESSAGE_SQL, self._message_params(message))
                 await db.commit()
                 return True
         except Exception as e:
             log_error(f"Error storing message: {e}")
             return False
 
+    async def store_messages(self, messages: list[Message]) -> bool:
+        """Store several messages in a single transaction"""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.executemany(
+                    self._INSERT_MESSAGE_SQL, (self._message_params(m) for m in messages)
+                )
+                await db.commit()
+                return True
+        except Exception as e:
+            log_error(f"Error storing {len(messages)} messages: {e}")
+            return False
+
     async def get_messages_for_date(self, target_date: date | None = None) -> list[Message]:
         """Get all messages for a specific date (defaults to today)"""
         if target_date is None:
@@ -1,6 +1,5 @@
 """Global test fixtures and configuration for Aurora test suite."""
 
-import asyncio
 import os
 import sqlite3
 import sys
@@ -64,15 +63,6 @@ def pytest_sessionfinish(session, exitstatus):
 # Import app modules
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test session."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def mock_config_manager():
     """Mock the ConfigManager singleton."""
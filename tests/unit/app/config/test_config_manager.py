@@ -4,7 +4,6 @@ Unit tests for the ConfigManager singleton.
 
 import json
 import os
-import tempfile
 import threading
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -37,26 +36,18 @@ class TestConfigManager:
             "system": {"models_dir": "test_dir"},
         }
 
-        # Create a temporary config file
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
-            json.dump(test_config, temp_file)
-            temp_file_path = temp_file.name
-
-        try:
-            # Use patch.object for an instance attribute
-            with patch.object(ConfigManager, "_validate_config", return_value=True):
-                cm = ConfigManager()
-                # Patch the instance attribute
-                cm.config_file = temp_file_path
-                cm.load_config()
-                config = cm._config
-
-                assert config["ui"]["activate"] is True
+        with (
+            patch("os.path.isfile", return_value=True),
+            patch("builtins.open", mock_open(read_data=json.dumps(test_config))),
+            patch.object(ConfigManager, "_validate_config", return_value=True),
+        ):
+            cm = ConfigManager()
+            cm.config_file = "/tmp/test_config.json"
+            cm.load_config()
+            config = cm._config
 
-                assert config["system"]["models_dir"] == "test_dir"
-        finally:
-            # Clean up the temporary file
-            os.unlink(temp_file_path)
+        assert config["ui"]["activate"] is True
+        assert config["system"]["models_dir"] == "test_dir"
 
     def test_default_config_generation(self, tmp_path):
         """Test generation of default configuration when file doesn't exist."""
@@ -88,13 +79,12 @@ class TestConfigManager:
         """Test validation of configuration against schema."""
         ConfigManager._instance = None
 
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
-            json.dump(invalid_config, temp_file)
-            temp_file_path = temp_file.name
-
-        try:
+        with (
+            patch("os.path.isfile", return_value=True),
+            patch("builtins.open", mock_open(read_data=json.dumps(invalid_config))),
+        ):
             cm = ConfigManager()
-            cm.config_file = temp_file_path
+            cm.config_file = "/tmp/test_config.json"
 
             with patch.object(ConfigManager, "_validate_config") as mock_validate:
                 mock_validate.side_effect = ValueError("Test validation error")
@@ -106,9 +96,6 @@ class TestConfigManager:
                     except RuntimeError as e:
                         assert "Test validation error" in str(e)
 
-        finally:
-            os.unlink(temp_file_path)
-
     def test_configuration_persistence(self):
         """Test that configuration changes are persisted to disk."""
         # Reset the singleton instance
@@ -119,33 +106,29 @@ class TestConfigManager:
             "system": {"models_dir": "test_dir"},
         }
 
-        # Create a temporary config file
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
-            json.dump(test_config, temp_file)
-            temp_file_path = temp_file.name
-
-        try:
+        with (
+            patch("os.path.isfile", return_value=True),
+            patch("builtins.open", mock_open(read_data=json.dumps(test_config))),
+        ):
             # Create instance first
             cm = ConfigManager()
             # Then patch instance attributes
-            cm.config_file = temp_file_path
+            cm.config_file = "/tmp/test_config.json"
 
             with patch.object(ConfigManager, "_validate_config", return_value=True):
                 # Explicitly reload the config from our test file
                 cm.load_config()
 
-                # Update a config value using direct access since set_config_value might not exist
-                with patch.object(ConfigManager, "save_config") as mock_save:
-                    cm._config["ui"]["activate"] = False
-                    cm.save_config()
+        # Update a config value using direct access since set_config_value might not exist
+        with patch.object(ConfigManager, "save_config") as mock_save:
+            cm._config["ui"]["activate"] = False
+            cm.save_config()
 
-                    # Check the config was updated in memory
-                    assert cm._config["ui"]["activate"] is False
+            # Check the config was updated in memory
+            assert cm._config["ui"]["activate"] is False
 
-                    # Check that save_config was called
-                    mock_save.assert_called_once()
-        finally:
-            os.unlink(temp_file_path)
+            # Check that save_config was called
+            mock_save.assert_called_once()
 
     def test_observer_pattern(self):
         """Test the observer pattern for configuration changes."""
@@ -167,7 +150,7 @@ class TestConfigManager:
             cm.config_file = "/tmp/test_config.json"
 
             # Register the observer
-            cm._observers.append(observer)
+            cm.add_observer(observer)
 
             # Use the actual _notify_observers method from the class
             # since we see it exists in the implementation
@@ -179,7 +162,7 @@ class TestConfigManager:
                 observer.assert_called_once_with("test.value", "old_value", 123)
 
                 # Remove the observer
-                cm._observers.remove(observer)
+                cm.remove_observer(observer)
 
                 # Reset the mock for the second test
                 observer.reset_mock()
@@ -2,95 +2,108 @@
 Tests for configuration field metadata extraction
 """
 
+from types import MappingProxyType
+
 import pytest
 
 from app.services.config.config_manager import ConfigManager
 
+EXPECTED_LLM_PROVIDERS = ("llama_cpp", "openai", "huggingface_endpoint", "huggingface_pipeline")
+EXPECTED_STT_LANGUAGES = ("", "en", "pt", "es", "fr", "de", "it", "ja", "ko", "zh")
+
 
 class TestConfigFieldMetadata:
     """Tests for the field metadata functionality in ConfigManager."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def config_manager(self):
-        """Get a ConfigManager instance for testing."""
+        """Get a ConfigManager instance shared across the session."""
         return ConfigManager()
 
-    def test_get_field_metadata_returns_dict(self, config_manager):
-        """Test that get_field_metadata returns a dictionary."""
-        metadata = config_manager.get_field_metadata()
-        assert isinstance(metadata, dict)
-        assert len(metadata) > 0
-
-    def test_ui_fields_metadata(self, config_manager):
+    @pytest.fixture(scope="session")
+    def field_metadata(self, config_manager):
+        """Field metadata comes from the static schema, so extract it once per session."""
+        return config_manager.get_field_metadata()
+
+    def test_get_field_metadata_returns_mapping(self, field_metadata):
+        """Test that get_field_metadata returns a non-empty read-only mapping."""
+        assert isinstance(field_metadata, MappingProxyType)
+        assert len(field_metadata) > 0
+        with pytest.raises(TypeError):
+            field_metadata["ui.activate"] = {}
+
+    def test_field_metadata_is_cached(self, config_manager):
+        """Test that repeated calls reuse the extracted metadata until the config reloads."""
+        first = config_manager.get_field_metadata()
+        assert config_manager.get_field_metadata() is first
+
+        config_manager._field_metadata = None
+        rebuilt = config_manager.get_field_metadata()
+        assert rebuilt is not first
+        assert rebuilt == first
+
+    def test_ui_fields_metadata(self, field_metadata):
         """Test that UI fields have correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        ui_activate = metadata.get("ui.activate")
+        ui_activate = field_metadata.get("ui.activate")
         assert ui_activate is not None
         assert ui_activate["type"] == "bool"
         assert "Enable graphical user interface" in ui_activate["description"]
 
-        ui_dark_mode = metadata.get("ui.dark_mode")
+        ui_dark_mode = field_metadata.get("ui.dark_mode")
         assert ui_dark_mode is not None
         assert ui_dark_mode["type"] == "bool"
         assert "dark mode" in ui_dark_mode["description"].lower()
 
-    def test_llm_provider_choice_field(self, config_manager):
+    def test_llm_provider_choice_field(self, field_metadata):
         """Test that LLM provider has correct choice metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        llm_provider = metadata.get("services.orchestrator.llm.provider")
+        llm_provider = field_metadata.get("services.orchestrator.llm.provider")
         assert llm_provider is not None
         assert llm_provider["type"] == "choice"
         assert "choices" in llm_provider
 
-        expected_choices = ["llama_cpp", "openai", "huggingface_endpoint", "huggingface_pipeline"]
-        assert llm_provider["choices"] == expected_choices
+        assert tuple(llm_provider["choices"]) == EXPECTED_LLM_PROVIDERS
         assert "LLM provider" in llm_provider["description"]
 
-    def test_numeric_fields_with_constraints(self, config_manager):
+    def test_numeric_fields_with_constraints(self, field_metadata):
         """Test that numeric fields have correct min/max constraints."""
-        metadata = config_manager.get_field_metadata()
-
-        temp_field = metadata.get("services.orchestrator.llm.local.llama_cpp.options.temperature")
+        temp_field = field_metadata.get(
+            "services.orchestrator.llm.local.llama_cpp.options.temperature"
+        )
         assert temp_field is not None
         assert temp_field["type"] == "float"
         assert temp_field["min"] == 0
         assert temp_field["max"] == 2
         assert "temperature" in temp_field["description"].lower()
 
-        n_ctx_field = metadata.get("services.orchestrator.llm.local.llama_cpp.options.n_ctx")
+        n_ctx_field = field_metadata.get("services.orchestrator.llm.local.llama_cpp.options.n_ctx")
         assert n_ctx_field is not None
         assert n_ctx_field["type"] == "int"
         assert n_ctx_field["min"] == 512
         assert n_ctx_field["max"] == 32768
 
-    def test_plugin_activation_fields(self, config_manager):
+    @pytest.mark.parametrize(
+        "plugin,expected_name",
+        [
+            ("jira", "jira"),
+            ("openrecall", "openrecall"),
+            ("brave_search", "brave search"),
+            ("github", "github"),
+            ("slack", "slack"),
+            ("gmail", "gmail"),
+            ("gcalendar", "google calendar"),
+        ],
+    )
+    def test_plugin_activation_fields(self, field_metadata, plugin, expected_name):
         """Test that plugin activation fields have correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        plugins = {
-            "jira": "jira",
-            "openrecall": "openrecall",
-            "brave_search": "brave search",
-            "github": "github",
-            "slack": "slack",
-            "gmail": "gmail",
-            "gcalendar": "google calendar",
-        }
-
-        for plugin, expected_name in plugins.items():
-            activate_field = metadata.get(f"services.tooling.plugins.{plugin}.activate")
-            assert activate_field is not None, f"Missing metadata for {plugin}.activate"
-            assert activate_field["type"] == "bool"
-            assert "description" in activate_field
-            assert expected_name.lower() in activate_field["description"].lower()
-
-    def test_nested_field_paths(self, config_manager):
-        """Test that deeply nested configuration paths work correctly."""
-        metadata = config_manager.get_field_metadata()
+        activate_field = field_metadata.get(f"services.tooling.plugins.{plugin}.activate")
+        assert activate_field is not None, f"Missing metadata for {plugin}.activate"
+        assert activate_field["type"] == "bool"
+        assert "description" in activate_field
+        assert expected_name.lower() in activate_field["description"].lower()
 
-        nested_field = metadata.get(
+    def test_nested_field_paths(self, field_metadata):
+        """Test that deeply nested configuration paths work correctly."""
+        nested_field = field_metadata.get(
             "services.orchestrator.llm.local.llama_cpp.options.repeat_penalty"
         )
         assert nested_field is not None
@@ -98,23 +111,17 @@ class TestConfigFieldMetadata:
         assert nested_field["min"] == 0.1
         assert nested_field["max"] == 2.0
 
-    def test_speech_language_choices(self, config_manager):
+    def test_speech_language_choices(self, field_metadata):
         """Test that speech to text language field has correct choices."""
-        metadata = config_manager.get_field_metadata()
-
-        lang_field = metadata.get("services.stt.language")
+        lang_field = field_metadata.get("services.stt.language")
         assert lang_field is not None
         assert lang_field["type"] == "choice"
-
-        expected_langs = ["", "en", "pt", "es", "fr", "de", "it", "ja", "ko", "zh"]
-        assert lang_field["choices"] == expected_langs
+        assert tuple(lang_field["choices"]) == EXPECTED_STT_LANGUAGES
         assert "auto-detect" in lang_field["description"]
 
-    def test_mcp_enabled_field(self, config_manager):
+    def test_mcp_enabled_field(self, field_metadata):
         """Test that MCP enabled field has correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        mcp_enabled = metadata.get("services.tooling.mcp.enabled")
+        mcp_enabled = field_metadata.get("services.tooling.mcp.enabled")
         assert mcp_enabled is not None
         assert mcp_enabled["type"] == "bool"
         assert "model context protocol" in mcp_enabled["description"].lower()
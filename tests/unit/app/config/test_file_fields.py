@@ -2,129 +2,120 @@
 Tests for file field functionality in the configuration system
 """
 
+import re
+from typing import Any, NamedTuple
+
 import pytest
 
 from app.services.config.config_manager import ConfigManager
 
+# Windows file-dialog filter: "Description (*.ext)|*.ext" pairs joined by "|",
+# e.g. "ONNX files (*.onnx)|*.onnx|All files (*.*)|*.*"
+_FILTER_PAIR = r"[^|()]*\([^|()]+\)[^|()]*\|(?:[^|]*\*\.[^|]*|\*)"
+FILE_FILTER_RE = re.compile(rf"^{_FILTER_PAIR}(?:\|{_FILTER_PAIR})*$")
+
+EXPECTED_FILE_FIELDS = (
+    "services.tts.model_file_path",
+    "services.tts.model_config_file_path",
+    "services.tts.piper_path",
+    "services.orchestrator.llm.local.llama_cpp.options.model_path",
+    "services.tooling.plugins.google.credentials_file",
+)
+
+
+class ClassifiedFields(NamedTuple):
+    """File fields keyed by path, split by how they were marked as files."""
+
+    by_type: dict[str, dict[str, Any]]
+    by_ui_type: dict[str, dict[str, Any]]
+
 
 class TestFileFieldMetadata:
     """Tests for file field metadata functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def config_manager(self):
-        """Get a ConfigManager instance for testing."""
+        """Get a ConfigManager instance shared across the session."""
         return ConfigManager()
 
-    def test_file_fields_detected(self, config_manager):
+    @pytest.fixture(scope="session")
+    def field_metadata(self, config_manager):
+        """Field metadata comes from the static schema, so extract it once per session."""
+        return config_manager.get_field_metadata()
+
+    @pytest.fixture(scope="session")
+    def classified_fields(self, field_metadata):
+        """Collect file fields by resolved ``type`` and by raw ``ui_type`` in one pass."""
+        by_type = {}
+        by_ui_type = {}
+        for field_path, field_meta in field_metadata.items():
+            if field_meta.get("type") == "file":
+                by_type[field_path] = field_meta
+            if field_meta.get("ui_type") == "file":
+                by_ui_type[field_path] = field_meta
+        return ClassifiedFields(by_type=by_type, by_ui_type=by_ui_type)
+
+    def test_file_fields_detected(self, classified_fields):
         """Test that file fields are properly detected with correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        # Filter to only file type fields
-        file_fields = {k: v for k, v in metadata.items() if v.get("type") == "file"}
+        file_fields = classified_fields.by_type
 
         # Verify we have the expected file fields
-        expected_file_fields = [
-            "services.tts.model_file_path",
-            "services.tts.model_config_file_path",
-            "services.tts.piper_path",
-            "services.orchestrator.llm.local.llama_cpp.options.model_path",
-            "services.tooling.plugins.google.credentials_file",
-        ]
-
-        for field_path in expected_file_fields:
+        for field_path in EXPECTED_FILE_FIELDS:
             assert field_path in file_fields, f"File field {field_path} not found"
 
-        assert len(file_fields) == len(expected_file_fields), (
-            f"Expected {len(expected_file_fields)} file fields, got {len(file_fields)}"
+        assert len(file_fields) == len(EXPECTED_FILE_FIELDS), (
+            f"Expected {len(EXPECTED_FILE_FIELDS)} file fields, got {len(file_fields)}"
         )
 
-    def test_tts_model_file_metadata(self, config_manager):
-        """Test TTS model file field has correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        field = metadata.get("services.tts.model_file_path")
-        assert field is not None
-        assert field["ui_type"] == "file"
-        assert "file_filter" in field
-        assert "ONNX files" in field["file_filter"]
-        assert "*.onnx" in field["file_filter"]
-        assert "All files" in field["file_filter"]
-        assert "TTS model file" in field["description"]
-
-    def test_tts_config_file_metadata(self, config_manager):
-        """Test TTS config file field has correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        field = metadata.get("services.tts.model_config_file_path")
-        assert field is not None
-        assert field["ui_type"] == "file"
-        assert "file_filter" in field
-        assert "Text files" in field["file_filter"]
-        assert "*.txt" in field["file_filter"]
-        assert "configuration file" in field["description"]
-
-    def test_piper_executable_metadata(self, config_manager):
-        """Test Piper executable field has correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        field = metadata.get("services.tts.piper_path")
-        assert field is not None
-        assert field["ui_type"] == "file"
-        assert "file_filter" in field
-        assert "Executable files" in field["file_filter"]
-        assert "*.exe" in field["file_filter"]
-        assert "Piper TTS executable" in field["description"]
-
-    def test_llama_model_file_metadata(self, config_manager):
-        """Test Llama.cpp model file field has correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        field = metadata.get("services.orchestrator.llm.local.llama_cpp.options.model_path")
-        assert field is not None
-        assert field["ui_type"] == "file"
-        assert "file_filter" in field
-        assert "GGUF files" in field["file_filter"]
-        assert "*.gguf" in field["file_filter"]
-        assert "model file" in field["description"]
-
-    def test_google_credentials_metadata(self, config_manager):
-        """Test Google credentials file field has correct metadata."""
-        metadata = config_manager.get_field_metadata()
-
-        field = metadata.get("services.tooling.plugins.google.credentials_file")
+    @pytest.mark.parametrize(
+        "field_path,filter_parts,description_part",
+        [
+            (
+                "services.tts.model_file_path",
+                ("ONNX files", "*.onnx", "All files"),
+                "TTS model file",
+            ),
+            (
+                "services.tts.model_config_file_path",
+                ("Text files", "*.txt"),
+                "configuration file",
+            ),
+            (
+                "services.tts.piper_path",
+                ("Executable files", "*.exe"),
+                "Piper TTS executable",
+            ),
+            (
+                "services.orchestrator.llm.local.llama_cpp.options.model_path",
+                ("GGUF files", "*.gguf"),
+                "model file",
+            ),
+            (
+                "services.tooling.plugins.google.credentials_file",
+                ("JSON files", "*.json"),
+                "Google credentials",
+            ),
+        ],
+    )
+    def test_file_field_metadata(self, field_metadata, field_path, filter_parts, description_part):
+        """Test that each file field has a UI file type, file filter and description."""
+        field = field_metadata.get(field_path)
         assert field is not None
         assert field["ui_type"] == "file"
         assert "file_filter" in field
-        assert "JSON files" in field["file_filter"]
-        assert "*.json" in field["file_filter"]
-        assert "Google credentials" in field["description"]
+        for part in filter_parts:
+            assert part in field["file_filter"]
+        assert description_part in field["description"]
 
-    def test_file_filter_format(self, config_manager):
+    def test_file_filter_format(self, classified_fields):
         """Test that file filters are in the correct Windows format."""
-        metadata = config_manager.get_field_metadata()
+        # Sanity-check the pattern itself so a too-loose regex cannot pass silently
+        assert FILE_FILTER_RE.match("All files (*.*)|*.*")
+        assert not FILE_FILTER_RE.match("All files (*.*)")
+        assert not FILE_FILTER_RE.match("All files|*.*")
 
-        file_fields = {k: v for k, v in metadata.items() if v.get("ui_type") == "file"}
-
-        for field_path, field_meta in file_fields.items():
+        for field_path, field_meta in classified_fields.by_ui_type.items():
             file_filter = field_meta.get("file_filter", "")
-
-            # Should be in Windows format: "Description (*.ext)|*.ext|All files (*.*)|*.*"
-            assert "|" in file_filter, f"File filter for {field_path} should be in Windows format"
-
-            parts = file_filter.split("|")
-            assert len(parts) >= 2, f"File filter for {field_path} should have at least 2 parts"
-            assert len(parts) % 2 == 0, (
-                f"File filter for {field_path} should have even number of parts"
+            assert FILE_FILTER_RE.match(file_filter), (
+                f"File filter for {field_path} should be in Windows format, got {file_filter!r}"
             )
-
-            # Check that we have description and pattern pairs
-            for i in range(0, len(parts), 2):
-                description = parts[i]
-                pattern = parts[i + 1] if i + 1 < len(parts) else ""
-
-                assert "(" in description and ")" in description, (
-                    f"Description '{description}' should contain parentheses"
-                )
-                assert "*." in pattern or pattern == "*", (
-                    f"Pattern '{pattern}' should contain file extension pattern"
-                )
@@ -4,70 +4,78 @@ Unit tests for the DatabaseManager.
 
 import asyncio
 import contextlib
-import os
-import tempfile
+import sqlite3
 import uuid
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
 
 import aiosqlite
 import pytest
-import pytest_asyncio
 
 from app.services.db.manager import DatabaseManager
 from app.services.db.models import Message, MessageType
 
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_message(
+    i: int, *, mt: MessageType = MessageType.USER_TEXT, ts: datetime = _FIXED_TS
+) -> Message:
+    """Build a deterministic test message without a uuid4() or clock read per call."""
+    return Message(
+        id=f"m{i:06d}",
+        content=f"Test message {i}",
+        message_type=mt,
+        timestamp=ts,
+        metadata={"index": i},
+    )
+
 
 @pytest.mark.asyncio
 class TestDatabaseManager:
     """Tests for the DatabaseManager class."""
 
-    @pytest_asyncio.fixture
-    async def db_manager(self):
-        """Create a test database manager using an in-memory database."""
-        # Use file-based database for tests with a unique name
-        test_db = f"/tmp/aurora_test_{uuid.uuid4()}.db"
-
-        # Create the database manager with our test db
-        manager = DatabaseManager(db_path=test_db)
-
-        try:
-            # Create tables manually
-            async with aiosqlite.connect(test_db) as db:
-                await db.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS messages (
-                        id TEXT PRIMARY KEY,
-                        content TEXT NOT NULL,
-                        message_type TEXT NOT NULL,
-                        timestamp TEXT NOT NULL,
-                        session_id TEXT,
-                        metadata TEXT,
-                        source_type TEXT
-                    )
+    @pytest.fixture(scope="class")
+    def db_path(self, tmp_path_factory):
+        """Create the messages table once in a database file shared by the class."""
+        test_db = str(tmp_path_factory.mktemp("db") / "aurora_test.db")
+        with contextlib.closing(sqlite3.connect(test_db)) as conn:
+            # WAL persists in the file, so every connection the manager opens uses it
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
                 """
+                CREATE TABLE IF NOT EXISTS messages (
+                    id TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    message_type TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    session_id TEXT,
+                    metadata TEXT,
+                    source_type TEXT
                 )
-                await db.commit()
-
-            # Return the manager for testing
-            yield manager
-
-        finally:
-            # Clean up the test database file
-            with contextlib.suppress(FileNotFoundError, PermissionError):
-                os.unlink(test_db)
+            """
+            )
+            # Mirror migration 001 so recent-N reads walk the index instead of sorting
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)")
+            conn.commit()
+        return test_db
+
+    @pytest.fixture
+    def db_manager(self, db_path):
+        """Create a test database manager over an emptied messages table."""
+        with contextlib.closing(sqlite3.connect(db_path)) as conn:
+            conn.execute("DELETE FROM messages")
+            conn.commit()
+        return DatabaseManager(db_path=db_path)
 
     async def test_initialization(self, db_manager):
         """Test database initialization."""
-        # Check that the database was initialized
-        # Create a test connection to verify the database is accessible
-        async with aiosqlite.connect(db_manager.db_path) as conn:
-            # Check that the messages table exists
-            cursor = await conn.execute(
+        # Check that the messages table exists
+        with contextlib.closing(sqlite3.connect(db_manager.db_path)) as conn:
+            rows = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='messages'"
-            )
-            result = await cursor.fetchone()
-            assert result is not None
-            assert result[0] == "messages"
+            ).fetchall()
+        assert rows == [("messages",)]
 
     async def test_store_message(self, db_manager):
         """Test storing a message in the database."""
@@ -85,17 +93,32 @@ class TestDatabaseManager:
         message_id = message.id
 
         # Check that the message was stored correctly
-        # Connect to database and check
-        async with aiosqlite.connect(db_manager.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute(
-                "SELECT content, message_type FROM messages WHERE id = ?", (message_id,)
-            )
-            result = await cursor.fetchone()
+        stored = await db_manager.get_message_by_id(message_id)
+        assert stored is not None
+        assert stored.content == "Test message"
+        assert stored.message_type == MessageType.USER_TEXT
 
-        assert result is not None
-        assert result[0] == "Test message"
-        assert result[1] == MessageType.USER_TEXT.value
+    async def test_store_messages_rolls_back_batch(self, db_manager):
+        """Test that a failing row aborts the whole batch."""
+        message = Message(
+            content="Batched message",
+            message_type=MessageType.USER_TEXT,
+            timestamp=datetime.now(),
+            id=str(uuid.uuid4()),
+        )
+
+        # The duplicate primary key fails the second insert
+        assert not await db_manager.store_messages([message, message])
+        assert await db_manager.get_message_by_id(message.id) is None
+
+    async def test_metadata_round_trip(self, db_manager):
+        """Test that nested metadata survives storage."""
+        message = make_message(1)
+        message.metadata = {"index": 1, "tags": ["a", "b"], "nested": {"ok": True}}
+        assert await db_manager.store_message(message)
+
+        retrieved = await db_manager.get_message_by_id(message.id)
+        assert retrieved.metadata == message.metadata
 
     async def test_get_message_by_id(self, db_manager):
         """Test retrieving a message by ID."""
@@ -121,28 +144,36 @@ class TestDatabaseManager:
 
     async def test_get_recent_messages(self, db_manager):
         """Test retrieving recent messages."""
-        # Store multiple test messages
-        message_ids = []
-        for i in range(5):
-            message = Message(
-                content=f"Test message {i}",
-                message_type=MessageType.USER_TEXT if i % 2 == 0 else MessageType.ASSISTANT,
-                timestamp=datetime.now(),
-                id=str(uuid.uuid4()),
-                metadata={"index": i},
+        # Store multiple test messages in one batch
+        messages = [
+            make_message(
+                i,
+                mt=MessageType.USER_TEXT if i % 2 == 0 else MessageType.ASSISTANT,
+                ts=_FIXED_TS + timedelta(seconds=i),
             )
-            await db_manager.store_message(message)
-            message_ids.append(message.id)
+            for i in range(5)
+        ]
+        assert await db_manager.store_messages(messages)
 
         # Retrieve recent messages
         recent_messages = await db_manager.get_recent_messages(limit=3)
 
         assert len(recent_messages) == 3
-        # Messages should be in reverse chronological order (oldest first, based
-        # on the implementation)
-        assert "Test message" in recent_messages[0].content
-        assert "Test message" in recent_messages[1].content
-        assert "Test message" in recent_messages[2].content
+        # The three newest messages come back in chronological order (oldest first)
+        assert [m.content for m in recent_messages] == [
+            "Test message 2",
+            "Test message 3",
+            "Test message 4",
+        ]
+
+        # ORDER BY timestamp DESC LIMIT n is served by a reverse index scan, not a sort
+        with contextlib.closing(sqlite3.connect(db_manager.db_path)) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM messages ORDER BY timestamp DESC LIMIT 3"
+            ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_messages_timestamp" in details
+        assert "TEMP B-TREE" not in details
 
     async def test_update_message(self, db_manager):
         """Test updating a message."""
@@ -158,13 +189,9 @@ class TestDatabaseManager:
         assert success
         message_id = message.id
 
-        # Update the message
-        updated_message = Message(
-            id=message_id,
-            content="Updated content",
-            message_type=MessageType.USER_TEXT,
-            timestamp=datetime.now(),
-            metadata={"test": True, "updated": True},
+        # Update the message, copying over the fields that stay the same
+        updated_message = replace(
+            message, content="Updated content", metadata={**message.metadata, "updated": True}
         )
 
         success = await db_manager.update_message(updated_message)
@@ -197,27 +224,20 @@ class TestDatabaseManager:
         deleted_message = await db_manager.get_message_by_id(message_id)
         assert deleted_message is None
 
-    async def test_connection_handling(self):
+    async def test_connection_handling(self, tmp_path):
         """Test connection handling, especially ensuring connections are properly closed."""
-        # Create a temporary database file
-        fd, db_path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
+        db_path = str(tmp_path / "conn.db")
 
-        try:
-            # Create and initialize a database manager
-            db_manager = DatabaseManager(db_path=db_path)
-            await db_manager.initialize()
+        # Create and initialize a database manager
+        db_manager = DatabaseManager(db_path=db_path)
+        await db_manager.initialize()
 
-            # Test that we can connect to the database and run a query
-            async with aiosqlite.connect(db_path) as conn:
-                cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = await cursor.fetchall()
-                # We should have at least one table after initialization
-                assert len(tables) > 0
-
-        finally:
-            # Clean up the temporary file
-            os.unlink(db_path)
+        # Test that we can connect to the database and run a query
+        async with aiosqlite.connect(db_path) as conn:
+            cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            tables = await cursor.fetchall()
+            # We should have at least one table after initialization
+            assert len(tables) > 0
 
     async def test_error_handling(self):
         """Test error handling for database operations."""
@@ -233,24 +253,17 @@ class TestDatabaseManager:
 
         # Define a task to store a message
         async def store_task(index):
-            message = Message(
-                content=f"Concurrent message {index}",
-                message_type=MessageType.USER_TEXT,
-                timestamp=datetime.now(),
-                id=str(uuid.uuid4()),
-                metadata={"task": index},
-            )
+            message = make_message(index)
             success = await db_manager.store_message(message)
             return message.id if success else None
 
         # Create and run multiple concurrent tasks
-        tasks = [store_task(i) for i in range(10)]
-        message_ids = await asyncio.gather(*tasks)
+        message_ids = await asyncio.gather(*(store_task(i) for i in range(10)))
 
         # Check that all messages were stored
         for i, message_id in enumerate(message_ids):
             assert message_id is not None
             message = await db_manager.get_message_by_id(message_id)
             assert message is not None
-            assert message.content == f"Concurrent message {i}"
-            assert message.metadata.get("task") == i
+            assert message.content == f"Test message {i}"
+            assert message.metadata.get("index") == i
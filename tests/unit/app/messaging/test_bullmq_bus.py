@@ -4,12 +4,30 @@ Tests verify that BullMQBus provides the same interface and behavior as LocalBus
 """
 
 import asyncio
+import functools
+import inspect
+import types
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
 
 from app.messaging.bullmq_bus import BullMQBus
+from app.messaging.local_bus import LocalBus
+
+# The MessageBus surface both implementations must expose
+BUS_PUBLIC_METHODS = frozenset({"start", "stop", "publish", "subscribe", "request", "get_stats"})
+
+# Read straight from the class dict: no dir() sort and no descriptor lookups
+_BULLMQ_PUBLIC_METHODS = frozenset(
+    name for name, attr in vars(BullMQBus).items() if not name.startswith("_") and callable(attr)
+)
+
+
+@functools.cache
+def _param_names(func):
+    """Return the parameter names of ``func``, resolving each signature only once."""
+    return frozenset(inspect.signature(func).parameters)
 
 
 class SampleMessage(BaseModel):
@@ -19,6 +37,10 @@ class SampleMessage(BaseModel):
     value: int = 42
 
 
+# Shared payload for tests that only publish it; built once and never mutated
+SAMPLE_MSG = SampleMessage(content="test")
+
+
 class SampleResponse(BaseModel):
     """Test response payload."""
 
@@ -40,41 +62,38 @@ class FakeRedis:
         self.published.append((topic, payload))
 
 
-@pytest.fixture
-def mock_bullmq():
-    """Mock BullMQ dependencies."""
+@pytest.fixture(scope="module")
+def _bullmq_stub():
+    """Install one stub ``bullmq`` module for the whole test module."""
     # Create mock instances
-    queue_instance = MagicMock()
-    queue_instance.add = AsyncMock()
-    queue_instance.close = AsyncMock()
-
-    worker_instance = MagicMock()
-    worker_instance.close = AsyncMock()
-    worker_instance.on = MagicMock()
-
+    queue_instance = MagicMock(add=AsyncMock(), close=AsyncMock())
+    worker_instance = MagicMock(close=AsyncMock(), on=MagicMock())
     events_instance = MagicMock()
 
-    # Create mock classes
-    mock_queue = MagicMock(return_value=queue_instance)
-    mock_worker = MagicMock(return_value=worker_instance)
-    mock_events = MagicMock(return_value=events_instance)
+    # Stub module whose classes hand back the shared instances above
+    stub = types.ModuleType("bullmq")
+    stub.Queue = MagicMock(return_value=queue_instance)
+    stub.Worker = MagicMock(return_value=worker_instance)
+    stub.QueueEvents = MagicMock(return_value=events_instance)
 
-    # Patch the bullmq module before it's imported
-    mock_bullmq_module = MagicMock()
-    mock_bullmq_module.Queue = mock_queue
-    mock_bullmq_module.Worker = mock_worker
-    mock_bullmq_module.QueueEvents = mock_events
-
-    with patch.dict("sys.modules", {"bullmq": mock_bullmq_module}):
+    with patch.dict("sys.modules", {"bullmq": stub}):
         yield {
-            "Queue": mock_queue,
-            "Worker": mock_worker,
-            "QueueEvents": mock_events,
+            "Queue": stub.Queue,
+            "Worker": stub.Worker,
+            "QueueEvents": stub.QueueEvents,
             "queue_instance": queue_instance,
             "worker_instance": worker_instance,
         }
 
 
+@pytest.fixture
+def mock_bullmq(_bullmq_stub):
+    """Mock BullMQ dependencies, with call records cleared after each test."""
+    yield _bullmq_stub
+    for mock in _bullmq_stub.values():
+        mock.reset_mock()
+
+
 @pytest.mark.asyncio
 class TestBullMQBusInterface:
     """Test BullMQBus implements the same interface as LocalBus."""
@@ -223,7 +242,7 @@ class TestBullMQBusInterface:
             subscribers={b"event.Config.Updated.worker1", "event.Config.Updated.worker2"}
         )
 
-        message = SampleMessage(content="test")
+        message = SAMPLE_MSG
 
         await bus.publish("Config.Updated", message, event=True)
 
@@ -237,7 +256,7 @@ class TestBullMQBusInterface:
         bus._Queue = mock_bullmq["Queue"]
         bus._Worker = mock_bullmq["Worker"]
 
-        message = SampleMessage(content="test")
+        message = SAMPLE_MSG
 
         await bus.publish(
             "TTS.Request",
@@ -257,7 +276,7 @@ class TestBullMQBusInterface:
         bus._Queue = mock_bullmq["Queue"]
         bus._Worker = mock_bullmq["Worker"]
 
-        message = SampleMessage(content="test")
+        message = SAMPLE_MSG
 
         await bus.publish(
             "reply.SampleMessage.abc-123",
@@ -279,28 +298,8 @@ class TestBullMQBusInterface:
 
         message = SampleMessage(content="request")
 
-        # Mock the response by simulating a future resolution
-        async def mock_request():
-            # Create the request
-            task = asyncio.create_task(
-                bus.request(
-                    "TTS.Request",
-                    message,
-                    priority=10,
-                    timeout=1.0,
-                )
-            )
-
-            # Give time for subscription to happen
-            await asyncio.sleep(0.1)
-
-            # Simulate timeout
-            await asyncio.sleep(1.1)
-
-            result = await task
-            return result
-
-        result = await mock_request()
+        # Nothing replies; a zero timeout makes wait_for give up at once, no clock involved
+        result = await bus.request("TTS.Request", message, priority=10, timeout=0)
 
         # Should timeout and return error
         assert result.ok is False
@@ -364,7 +363,7 @@ class TestBullMQBusInterface:
                 "TTS.Request",
                 message,
                 priority=10,
-                timeout=0.01,
+                timeout=0,
             )
             assert result.ok is False
 
@@ -390,12 +389,9 @@ class TestBullMQBusInterface:
         bus._Queue = mock_bullmq["Queue"]
         bus._Worker = mock_bullmq["Worker"]
 
-        message = SampleMessage(content="test")
-
-        await bus.publish("TTS.Request", message, event=False)
-        assert bus._stats["published"] == 1
+        message = SAMPLE_MSG
 
-        await bus.publish("TTS.Request", message, event=False)
+        await asyncio.gather(*(bus.publish("TTS.Request", message, event=False) for _ in range(2)))
         assert bus._stats["published"] == 2
 
     async def test_multiple_handlers_same_topic(self, mock_bullmq):
@@ -440,60 +436,20 @@ class TestBullMQBusCompatibility:
 
     async def test_has_same_methods_as_localbus(self):
         """Verify BullMQBus has all the same public methods as LocalBus."""
-        from app.messaging.local_bus import LocalBus  # noqa: F401
-
-        bullmq_methods = {
-            name
-            for name in dir(BullMQBus)
-            if not name.startswith("_") and callable(getattr(BullMQBus, name))
-        }
-
-        # Check all public methods exist
-        assert "start" in bullmq_methods
-        assert "stop" in bullmq_methods
-        assert "publish" in bullmq_methods
-        assert "subscribe" in bullmq_methods
-        assert "request" in bullmq_methods
-        assert "get_stats" in bullmq_methods
+        assert BUS_PUBLIC_METHODS <= _BULLMQ_PUBLIC_METHODS
 
     async def test_publish_signature_matches(self):
         """Verify publish method signature matches LocalBus."""
-        import inspect
-
-        from app.messaging.local_bus import LocalBus
-
-        local_sig = inspect.signature(LocalBus.publish)
-        bullmq_sig = inspect.signature(BullMQBus.publish)
-
-        # Both should have the same parameters
-        local_params = set(local_sig.parameters.keys())
-        bullmq_params = set(bullmq_sig.parameters.keys())
-
         # reply_to is added to BullMQBus
-        assert local_params.issubset(bullmq_params)
+        assert _param_names(LocalBus.publish) <= _param_names(BullMQBus.publish)
 
     async def test_request_signature_matches(self):
         """Verify request method signature matches LocalBus."""
-        import inspect
-
-        from app.messaging.local_bus import LocalBus
-
-        local_sig = inspect.signature(LocalBus.request)
-        bullmq_sig = inspect.signature(BullMQBus.request)
-
-        # Both should have the same parameters
-        assert set(local_sig.parameters.keys()) == set(bullmq_sig.parameters.keys())
+        assert _param_names(LocalBus.request) == _param_names(BullMQBus.request)
 
     async def test_subscribe_signature_matches(self):
         """Verify subscribe method signature matches LocalBus."""
-        import inspect
-
-        from app.messaging.local_bus import LocalBus
-
-        local_sig = inspect.signature(LocalBus.subscribe)
-        bullmq_sig = inspect.signature(BullMQBus.subscribe)
-
-        assert set(local_sig.parameters.keys()) == set(bullmq_sig.parameters.keys())
+        assert _param_names(LocalBus.subscribe) == _param_names(BullMQBus.subscribe)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ import pytest
 import pytest_asyncio
 from pydantic import BaseModel
 
+from app.messaging import bus_runtime
 from app.messaging.bus import Envelope, Event
 from app.messaging.bus_runtime import get_bus, set_bus
 from app.messaging.local_bus import LocalBus
@@ -18,6 +19,23 @@ class MessageEvent(Event):
     value: int = 0
 
 
+class CapturingHandler:
+    """Bus handler that records envelopes and signals once ``expected`` have arrived."""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.received: list[Envelope] = []
+        self.done = asyncio.Event()
+
+    async def __call__(self, env: Envelope) -> None:
+        self.received.append(env)
+        if len(self.received) >= self.expected:
+            self.done.set()
+
+    async def wait(self, timeout: float = 1.0) -> None:
+        await asyncio.wait_for(self.done.wait(), timeout)
+
+
 @pytest_asyncio.fixture
 async def local_bus():
     """Fixture providing a LocalBus instance with topic validation disabled for testing."""
@@ -28,8 +46,11 @@ async def local_bus():
 
 
 @pytest.mark.asyncio
-async def test_bus_runtime_singleton(local_bus):
+async def test_bus_runtime_singleton(local_bus, monkeypatch):
     """Test bus runtime singleton pattern."""
+    # Restore whatever global bus was installed before, so other tests never see ours
+    monkeypatch.setattr(bus_runtime, "_bus", bus_runtime._bus)
+
     # Set the bus
     set_bus(local_bus)
 
@@ -46,10 +67,7 @@ async def test_bus_runtime_singleton(local_bus):
 @pytest.mark.asyncio
 async def test_local_bus_publish_subscribe(local_bus):
     """Test basic publish/subscribe functionality."""
-    received_messages = []
-
-    async def handler(env: Envelope):
-        received_messages.append(env.payload)
+    handler = CapturingHandler(expected=1)
 
     # Subscribe to topic
     local_bus.subscribe("test.topic", handler)
@@ -59,9 +77,10 @@ async def test_local_bus_publish_subscribe(local_bus):
     await local_bus.publish("test.topic", test_event)
 
     # Wait for processing
-    await asyncio.sleep(0.1)
+    await handler.wait()
 
     # Check message was received
+    received_messages = [env.payload for env in handler.received]
     assert len(received_messages) == 1
     assert isinstance(received_messages[0], MessageEvent)
     assert received_messages[0].message == "Hello"
@@ -79,14 +98,18 @@ async def test_local_bus_priority_ordering(local_bus):
     # Subscribe to command topic
     local_bus.subscribe("test.command", handler)
 
-    # Publish commands with different priorities
-    for priority in [80, 10, 50, 5, 90]:
-        await local_bus.publish(
-            "test.command",
-            MessageEvent(message=f"Priority {priority}"),
-            event=False,  # Command, not event
-            priority=priority,
+    # Publish commands with different priorities; the inputs are fixed, so skip validation
+    await asyncio.gather(
+        *(
+            local_bus.publish(
+                "test.command",
+                MessageEvent.model_construct(message=f"Priority {priority}"),
+                event=False,  # Command, not event
+                priority=priority,
+            )
+            for priority in [80, 10, 50, 5, 90]
         )
+    )
 
     # Wait for processing
     await asyncio.sleep(0.2)
@@ -99,38 +122,41 @@ async def test_local_bus_priority_ordering(local_bus):
 @pytest.mark.asyncio
 async def test_local_bus_wildcard_subscription(local_bus):
     """Test wildcard topic subscription."""
-    received_messages = []
-
-    async def handler(env: Envelope):
-        received_messages.append(env.type)
+    handler = CapturingHandler(expected=2)
 
     # Subscribe with wildcard
     local_bus.subscribe("test.*", handler)
 
     # Publish to different topics
-    await local_bus.publish("test.topic1", MessageEvent(message="1"))
-    await local_bus.publish("test.topic2", MessageEvent(message="2"))
-    await local_bus.publish("other.topic", MessageEvent(message="3"))
+    await local_bus.publish("test.topic1", MessageEvent.model_construct(message="1"))
+    await local_bus.publish("test.topic2", MessageEvent.model_construct(message="2"))
+    await local_bus.publish("other.topic", MessageEvent.model_construct(message="3"))
 
-    # Wait for processing
+    # Wait for both matching messages, then give a stray other.topic delivery time to land
+    await handler.wait()
     await asyncio.sleep(0.1)
 
     # Should only receive messages matching wildcard
+    received_messages = [env.type for env in handler.received]
     assert len(received_messages) == 2
     assert "test.topic1" in received_messages
     assert "test.topic2" in received_messages
 
 
 @pytest.mark.asyncio
-async def test_local_bus_command_retry(local_bus):
+async def test_local_bus_command_retry(local_bus, monkeypatch):
     """Test command retry logic on failure."""
+    # Shrink the 0.5s/1.0s backoff schedule; the retry path itself is unchanged
+    monkeypatch.setattr("app.messaging.local_bus._BACKOFF_BASE", 0.001)
     attempt_count = 0
+    done = asyncio.Event()
 
     async def failing_handler(env: Envelope):
         nonlocal attempt_count
         attempt_count += 1
         if attempt_count < 3:
             raise ValueError("Simulated failure")
+        done.set()
 
     # Subscribe to command topic
     local_bus.subscribe("test.retry", failing_handler)
@@ -143,8 +169,8 @@ async def test_local_bus_command_retry(local_bus):
         max_attempts=3,
     )
 
-    # Wait for retries (with exponential backoff: 0.25s, 0.5s, 1.0s)
-    await asyncio.sleep(2.0)
+    # Wait for the final attempt to succeed
+    await asyncio.wait_for(done.wait(), timeout=5.0)
 
     # Handler should be called 3 times (initial + 2 retries)
     assert attempt_count == 3
@@ -165,8 +191,7 @@ async def test_local_bus_stats(local_bus):
     assert stats["published"] >= 2
 
 
-@pytest.mark.asyncio
-async def test_envelope_creation():
+def test_envelope_creation():
     """Test envelope creation and attributes."""
     message = MessageEvent(message="Test", value=123)
 
@@ -25,20 +25,20 @@ class TestSchedulerManager:
     @pytest.fixture
     def mock_db_manager(self):
         """Mock the SchedulerDatabaseService."""
-        mock = MagicMock()
         # Mock all the async methods we need
-        mock.initialize = AsyncMock()
-        mock.add_job = AsyncMock(return_value=True)
-        mock.update_job = AsyncMock(return_value=True)
-        mock.get_job = AsyncMock(return_value=None)
-        mock.get_all_jobs = AsyncMock(return_value=[])
-        mock.get_active_jobs = AsyncMock(return_value=[])
-        mock.get_ready_jobs = AsyncMock(return_value=[])
-        mock.delete_job = AsyncMock(return_value=True)
-        mock.deactivate_job = AsyncMock(return_value=True)
-        mock.get_job_history = AsyncMock(return_value=[])
-        mock.cleanup_old_jobs = AsyncMock(return_value=0)
-        return mock
+        return MagicMock(
+            initialize=AsyncMock(),
+            add_job=AsyncMock(return_value=True),
+            update_job=AsyncMock(return_value=True),
+            get_job=AsyncMock(return_value=None),
+            get_all_jobs=AsyncMock(return_value=[]),
+            get_active_jobs=AsyncMock(return_value=[]),
+            get_ready_jobs=AsyncMock(return_value=[]),
+            delete_job=AsyncMock(return_value=True),
+            deactivate_job=AsyncMock(return_value=True),
+            get_job_history=AsyncMock(return_value=[]),
+            cleanup_old_jobs=AsyncMock(return_value=0),
+        )
 
     @pytest_asyncio.fixture
     async def scheduler_manager(self, mock_db_manager):
@@ -4,12 +4,10 @@ Unit tests for a simple mock Graph under the orchestrator namespace.
 
 from unittest.mock import MagicMock
 
-import pytest
-
 
 class MockGraph:
-    async def ainvoke(self, input=None, config=None, stream_mode=None):
-        """Mock implementation of graph.ainvoke that returns a predefined result."""
+    def invoke(self, input=None, config=None, stream_mode=None):
+        """Mock implementation of graph.invoke that returns a predefined result."""
         return {
             "messages": [
                 {"role": "user", "content": "Test input"},
@@ -21,14 +19,13 @@ class MockGraph:
 class TestMockOrchestratorGraph:
     """Tests for the mock orchestrator graph using mock objects."""
 
-    @pytest.mark.asyncio
-    async def test_basic_graph_invocation(self):
+    def test_basic_graph_invocation(self):
         """Test basic graph invocation with mocks."""
         mock_graph = MockGraph()
 
         input_content = "Test input"
 
-        response = await mock_graph.ainvoke(
+        response = mock_graph.invoke(
             input={"messages": [{"role": "user", "content": input_content}]},
             config={"configurable": {"thread_id": "1"}},
             stream_mode="values",
@@ -39,15 +36,14 @@ class TestMockOrchestratorGraph:
         assert response["messages"][0]["role"] == "user"
         assert response["messages"][1]["role"] == "assistant"
 
-    @pytest.mark.asyncio
-    async def test_text_to_speech_integration(self):
+    def test_text_to_speech_integration(self):
         """Test integration with text-to-speech."""
         mock_graph = MockGraph()
         mock_tts = MagicMock()
 
         input_content = "Test input for TTS"
 
-        response = await mock_graph.ainvoke(
+        response = mock_graph.invoke(
             input={"messages": [{"role": "user", "content": input_content}]},
             config={"configurable": {"thread_id": "1"}},
             stream_mode="values",
@@ -58,12 +54,11 @@ class TestMockOrchestratorGraph:
 
         mock_tts.play.assert_called_once_with("Test response")
 
-    @pytest.mark.asyncio
-    async def test_tool_handling(self):
+    def test_tool_handling(self):
         """Test handling of tool calls."""
         mock_graph = MockGraph()
 
-        async def mock_ainvoke_with_tool(*args, **kwargs):
+        def mock_invoke_with_tool(*args, **kwargs):
             return {
                 "messages": [
                     {"role": "user", "content": "Use a tool"},
@@ -84,9 +79,9 @@ class TestMockOrchestratorGraph:
                 ]
             }
 
-        mock_graph.ainvoke = mock_ainvoke_with_tool
+        mock_graph.invoke = mock_invoke_with_tool
 
-        response = await mock_graph.ainvoke(
+        response = mock_graph.invoke(
             input={"messages": [{"role": "user", "content": "Use a tool"}]},
             config={"configurable": {"thread_id": "1"}},
             stream_mode="values",
@@ -8,182 +8,211 @@ This module tests the MCP client functionality including:
 - Error handling and edge cases
 """
 
+import sys
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from app.services.tooling.mcp import mcp_client
 from app.services.tooling.mcp.mcp_client import MCPClientManager, get_mcp_tools, initialize_mcp
 from app.shared.config.keys import ConfigKeys
 from app.shared.config.models import Mcp, Servers, Tooling
 
 
 def _make_tooling(*, mcp_enabled=True, servers=None):
-    """Build a Tooling model for test mocking."""
-    mcp = Mcp(enabled=mcp_enabled, servers=servers or {})
+    """Build a Tooling model for test mocking, with its own copy of each server config."""
+    servers = {name: server.model_copy(deep=True) for name, server in (servers or {}).items()}
+    mcp = Mcp(enabled=mcp_enabled, servers=servers)
     return Tooling(mcp=mcp)
 
 
-def _make_mock_config_api(*, mcp_enabled=True, servers=None):
-    """Return a mock config_api whose aget returns typed models."""
-    tooling = _make_tooling(mcp_enabled=mcp_enabled, servers=servers)
+# Server configs used as parametrize templates; _make_tooling copies them per test
+STDIO_SERVERS = {
+    "math": Servers(
+        command="python",
+        args=["/path/to/math_server.py"],
+        transport="stdio",
+        enabled=True,
+    )
+}
+HTTP_SERVERS = {
+    "weather": Servers(
+        url="http://localhost:8000/mcp/",
+        transport="streamable_http",
+        headers={"Authorization": "Bearer test_token"},
+        enabled=True,
+    )
+}
+DISABLED_STDIO_SERVERS = {
+    "math": Servers(
+        command="python",
+        args=["/path/to/math_server.py"],
+        transport="stdio",
+        enabled=False,
+    )
+}
 
-    async def mock_aget(key, model_or_default=None, **kwargs):
+_MCP_ENABLED_KEY = str(ConfigKeys.services.tooling.mcp.enabled)
+_TOOLING_KEY = str(ConfigKeys.services.tooling)
+
+
+class _ClientSpec:
+    """The MultiServerMCPClient surface MCPClientManager touches."""
+
+    async def get_tools(self): ...
+
+    async def close(self): ...
+
+
+class _ToolSpec:
+    """The tool surface the manager logs and the tests invoke."""
+
+    name = None
+    description = None
+
+    async def ainvoke(self, input): ...
+
+
+def _make_client(tools=()):
+    """Build a MultiServerMCPClient mock whose get_tools returns ``tools``."""
+    client = AsyncMock(spec_set=_ClientSpec)
+    client.get_tools.return_value = list(tools)
+    return client
+
+
+def _make_tool(name=None, description=""):
+    """Build a tool mock limited to the attributes the manager and tests read."""
+    tool = Mock(spec_set=_ToolSpec)
+    tool.name = name
+    tool.description = description
+    return tool
+
+
+class _StubConfigAPI:
+    """Lightweight config_api stand-in whose aget resolves from a dict of typed values."""
+
+    def __init__(self, values):
+        self._values = values
+
+    async def aget(self, key, model_or_default=None, **kwargs):
         k = str(key)
-        if k == str(ConfigKeys.services.tooling.mcp.enabled):
-            return mcp_enabled
-        if k == str(ConfigKeys.services.tooling):
-            return tooling
-        if "default" in kwargs:
-            return kwargs["default"]
-        return model_or_default
+        if k in self._values:
+            return self._values[k]
+        return kwargs.get("default", model_or_default)
 
-    mock = Mock()
-    mock.aget = AsyncMock(side_effect=mock_aget)
-    return mock
+
+def _make_stub_config_api(*, mcp_enabled=True, servers=None):
+    """Return a stub config_api whose aget returns typed models."""
+    return _StubConfigAPI(
+        {
+            _MCP_ENABLED_KEY: mcp_enabled,
+            _TOOLING_KEY: _make_tooling(mcp_enabled=mcp_enabled, servers=servers),
+        }
+    )
 
 
 @pytest.mark.unit
 class TestMCPClientManager:
     """Test the MCP client manager functionality."""
 
+    @pytest.fixture(autouse=True)
+    def mcp_config(self, monkeypatch):
+        """Install a stub config_api (MCP disabled) for every test.
+
+        Returns a setter that swaps in a stub built with the given settings.
+        """
+
+        def _install(**kwargs):
+            monkeypatch.setattr(mcp_client, "config_api", _make_stub_config_api(**kwargs))
+
+        _install(mcp_enabled=False)
+        return _install
+
     @pytest.fixture
     def mcp_manager(self):
         """Create a fresh MCP client manager."""
         return MCPClientManager()
 
-    @pytest.fixture
-    def mock_mcp_tools(self):
-        """Mock MCP tools for testing."""
+    @pytest.fixture(scope="session")
+    def _session_mcp_tools(self):
+        """Build the mock MCP tools once; they are read-only apart from call records."""
         mock_tools = []
         for name, desc in [
             ("add", "Add two numbers together."),
             ("subtract", "Subtract the second number from the first."),
             ("multiply", "Multiply two numbers together."),
         ]:
-            tool = Mock()
-            tool.name = name
-            tool.description = desc
+            tool = _make_tool(name, desc)
             tool.ainvoke = AsyncMock(return_value=42.0)
             mock_tools.append(tool)
         return mock_tools
 
+    @pytest.fixture
+    def mock_mcp_tools(self, _session_mcp_tools):
+        """Mock MCP tools for testing, with call records cleared per test."""
+        for tool in _session_mcp_tools:
+            tool.reset_mock()
+        return list(_session_mcp_tools)
+
     @pytest.mark.asyncio
-    async def test_initialize_with_disabled_mcp(self, mcp_manager):
+    async def test_initialize_with_disabled_mcp(self, mcp_manager, mcp_config):
         """Test initialization when MCP is disabled."""
-        mock_api = _make_mock_config_api(mcp_enabled=False)
+        mcp_config(mcp_enabled=False)
 
-        with patch("app.services.tooling.mcp.mcp_client.config_api", mock_api):
-            await mcp_manager.initialize()
+        await mcp_manager.initialize()
 
         assert not mcp_manager.is_initialized
         assert len(mcp_manager.get_tools()) == 0
 
     @pytest.mark.asyncio
-    async def test_initialize_with_no_servers(self, mcp_manager):
+    async def test_initialize_with_no_servers(self, mcp_manager, mcp_config):
         """Test initialization when no servers are configured."""
-        mock_api = _make_mock_config_api(mcp_enabled=True, servers={})
+        mcp_config(mcp_enabled=True, servers={})
 
-        with patch("app.services.tooling.mcp.mcp_client.config_api", mock_api):
-            await mcp_manager.initialize()
+        await mcp_manager.initialize()
 
         assert not mcp_manager.is_initialized
         assert len(mcp_manager.get_tools()) == 0
 
     @pytest.mark.asyncio
-    async def test_initialize_with_stdio_server(self, mcp_manager):
-        """Test initialization with a stdio server configuration."""
-        import sys
-
-        servers = {
-            "math": Servers(
-                command="python",
-                args=["/path/to/math_server.py"],
-                transport="stdio",
-                enabled=True,
-            )
-        }
-        mock_api = _make_mock_config_api(mcp_enabled=True, servers=servers)
-
-        mock_client = AsyncMock()
-        mock_tool = Mock()
-        mock_tool.name = "add"
-        mock_tool.description = "Add two numbers"
-        mock_client.get_tools.return_value = [mock_tool]
-
-        mock_mcp_module = Mock()
-        mock_mcp_module.MultiServerMCPClient = Mock(return_value=mock_client)
-
-        with (
-            patch("app.services.tooling.mcp.mcp_client.config_api", mock_api),
-            patch.dict(sys.modules, {"langchain_mcp_adapters.client": mock_mcp_module}),
-        ):
-            await mcp_manager.initialize()
-
-        assert mcp_manager.is_initialized
-        assert len(mcp_manager.get_tools()) == 1
-        assert mcp_manager.get_tools()[0].name == "add"
-
-    @pytest.mark.asyncio
-    async def test_initialize_with_http_server(self, mcp_manager):
-        """Test initialization with an HTTP server configuration."""
-        import sys
-
-        servers = {
-            "weather": Servers(
-                url="http://localhost:8000/mcp/",
-                transport="streamable_http",
-                headers={"Authorization": "Bearer test_token"},
-                enabled=True,
-            )
-        }
-        mock_api = _make_mock_config_api(mcp_enabled=True, servers=servers)
-
-        mock_client = AsyncMock()
-        mock_tool = Mock()
-        mock_tool.name = "get_weather"
-        mock_tool.description = "Get weather information"
-        mock_client.get_tools.return_value = [mock_tool]
+    @pytest.mark.parametrize(
+        "servers,expected_name,expect_initialized",
+        [
+            pytest.param(STDIO_SERVERS, "add", True, id="stdio"),
+            pytest.param(HTTP_SERVERS, "get_weather", True, id="http"),
+            pytest.param(DISABLED_STDIO_SERVERS, None, False, id="disabled"),
+        ],
+    )
+    async def test_initialize_variants(
+        self, mcp_manager, mcp_config, servers, expected_name, expect_initialized
+    ):
+        """Test initialization with stdio, HTTP and disabled server configurations."""
+        mcp_config(mcp_enabled=True, servers=servers)
+
+        mock_client = _make_client([_make_tool(expected_name)])
 
         mock_mcp_module = Mock()
         mock_mcp_module.MultiServerMCPClient = Mock(return_value=mock_client)
 
-        with (
-            patch("app.services.tooling.mcp.mcp_client.config_api", mock_api),
-            patch.dict(sys.modules, {"langchain_mcp_adapters.client": mock_mcp_module}),
-        ):
+        with patch.dict(sys.modules, {"langchain_mcp_adapters.client": mock_mcp_module}):
             await mcp_manager.initialize()
 
-        assert mcp_manager.is_initialized
-        assert len(mcp_manager.get_tools()) == 1
-        assert mcp_manager.get_tools()[0].name == "get_weather"
-
-    @pytest.mark.asyncio
-    async def test_initialize_with_disabled_server(self, mcp_manager):
-        """Test that disabled servers are not loaded."""
-        servers = {
-            "math": Servers(
-                command="python",
-                args=["/path/to/math_server.py"],
-                transport="stdio",
-                enabled=False,
-            )
-        }
-        mock_api = _make_mock_config_api(mcp_enabled=True, servers=servers)
-
-        with patch("app.services.tooling.mcp.mcp_client.config_api", mock_api):
-            await mcp_manager.initialize()
-
-        assert not mcp_manager.is_initialized
-        assert len(mcp_manager.get_tools()) == 0
+        if expect_initialized:
+            assert mcp_manager.is_initialized
+            assert [tool.name for tool in mcp_manager.get_tools()] == [expected_name]
+        else:
+            # Disabled servers are filtered out before the client is ever built
+            assert not mcp_manager.is_initialized
+            assert len(mcp_manager.get_tools()) == 0
+            mock_mcp_module.MultiServerMCPClient.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_close(self, mcp_manager):
         """Test closing MCP client connections."""
         # Set up a mock client
-        mock_client = AsyncMock()
-        mcp_manager._client = mock_client
+        mcp_manager._client = _make_client()
         mcp_manager._initialized = True
-        mcp_manager._tools = [Mock()]
+        mcp_manager._tools = [_make_tool()]
 
         await mcp_manager.close()
 
@@ -208,12 +237,11 @@ class TestMCPClientManager:
     @pytest.mark.asyncio
     async def test_client_close(self, mcp_manager):
         """Test closing MCP client connections."""
-        mock_client = AsyncMock()
-        mock_client.close = AsyncMock()
+        mock_client = _make_client()
 
         mcp_manager._client = mock_client
         mcp_manager._initialized = True
-        mcp_manager._tools = [Mock()]
+        mcp_manager._tools = [_make_tool()]
 
         await mcp_manager.close()
 
@@ -223,44 +251,84 @@ class TestMCPClientManager:
         assert not mcp_manager._initialized
 
 
+# _prepare_server_config is pure, so one manager serves every case
+_CONFIG_MANAGER = MCPClientManager()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "server_config,expected",
+    [
+        pytest.param(
+            {"transport": "stdio", "command": "python", "args": '["/path/to/math_server.py"]'},
+            {"transport": "stdio", "command": "python", "args": ["/path/to/math_server.py"]},
+            id="stdio",
+        ),
+        pytest.param(
+            {
+                "transport": "streamable_http",
+                "url": "http://localhost:8000/mcp/",
+                "headers": {"Authorization": "Bearer test_token"},
+                "enabled": True,
+            },
+            {
+                "transport": "streamable_http",
+                "url": "http://localhost:8000/mcp/",
+                "headers": {"Authorization": "Bearer test_token"},
+            },
+            id="http",
+        ),
+    ],
+)
+def test_prepare_server_config(server_config, expected):
+    """Test that server configs are reduced to what MultiServerMCPClient accepts."""
+    assert _CONFIG_MANAGER._prepare_server_config(server_config) == expected
+
+
 @pytest.mark.unit
 class TestMCPUtilityFunctions:
     """Test MCP utility functions."""
 
+    @pytest.fixture
+    def install_manager(self, monkeypatch):
+        """Return a setter that swaps in a mock mcp_client_manager for this test."""
+
+        def _install(**attrs):
+            mock_manager = Mock(**attrs)
+            mock_manager.initialize = AsyncMock()
+            monkeypatch.setattr(mcp_client, "mcp_client_manager", mock_manager)
+            return mock_manager
+
+        return _install
+
     @pytest.mark.asyncio
-    async def test_get_mcp_tools_with_uninitialized_client(self):
+    async def test_get_mcp_tools_with_uninitialized_client(self, install_manager):
         """Test get_mcp_tools when client is not initialized."""
-        with patch("app.services.tooling.mcp.mcp_client.mcp_client_manager") as mock_manager:
-            mock_manager.is_initialized = False
-            mock_manager.initialize = AsyncMock()
-            mock_manager.get_tools.return_value = []
+        mock_manager = install_manager(is_initialized=False)
+        mock_manager.get_tools.return_value = []
 
-            tools = await get_mcp_tools()
+        tools = await get_mcp_tools()
 
-            mock_manager.initialize.assert_called_once()
-            assert tools == []
+        mock_manager.initialize.assert_called_once()
+        assert tools == []
 
     @pytest.mark.asyncio
-    async def test_get_mcp_tools_with_initialized_client(self):
+    async def test_get_mcp_tools_with_initialized_client(self, install_manager):
         """Test get_mcp_tools when client is already initialized."""
         mock_tools = [Mock(name="test_tool")]
+        mock_manager = install_manager(is_initialized=True)
+        mock_manager.get_tools.return_value = mock_tools
 
-        with patch("app.services.tooling.mcp.mcp_client.mcp_client_manager") as mock_manager:
-            mock_manager.is_initialized = True
-            mock_manager.initialize = AsyncMock()
-            mock_manager.get_tools.return_value = mock_tools
-
-            tools = await get_mcp_tools()
+        tools = await get_mcp_tools()
 
-            mock_manager.initialize.assert_not_called()
-            assert tools == mock_tools
+        mock_manager.initialize.assert_not_called()
+        assert tools == mock_tools
 
     @pytest.mark.asyncio
-    async def test_initialize_mcp(self):
+    async def test_initialize_mcp(self, install_manager):
         """Test initialize_mcp function."""
-        with patch("app.services.tooling.mcp.mcp_client.mcp_client_manager") as mock_manager:
-            mock_manager.initialize = AsyncMock()
+        mock_manager = install_manager()
 
-            await initialize_mcp()
+        await initialize_mcp()
 
-            mock_manager.initialize.assert_called_once()
+        mock_manager.initialize.assert_called_once()